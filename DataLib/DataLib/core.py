@@ -289,6 +289,12 @@ class DataTable:
 
         return data
 
+    def _columns(self):
+        """Packages DataTable into a tuple of columns, each led by its header
+        when headers are set. Formatters are applied as in :meth:`_package`.
+        """
+        return tuple(zip(*self._package(dicts=False)))
+
     def _get_headers(self):
         """An *optional* list of strings to be used for header rows and attribute names.
 
@@ -4,33 +4,131 @@
 import csv
 from io import StringIO
 
+# Cell types whose ``str()`` matches what ``csv.writer`` would emit.
+_PLAIN_TYPES = frozenset((int, float, str))
+
+# Every character ``str()`` can produce for an int or float.
+_NUMERIC_CHARS = frozenset('0123456789+-.aefin')
+
+
+class _ListIO:
+    """Write target for ``csv.writer`` that collects output in a list.
+
+    Joining the parts once at the end avoids the repeated buffer growth
+    of writing into a :class:`io.StringIO`.
+    """
+
+    __slots__ = ('parts',)
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, s):
+        self.parts.append(s)
+
+    def pop(self):
+        line = ''.join(self.parts)
+        self.parts.clear()
+        return line
+
 
 class CSVFormat:
     title = 'csv'
     extensions = ('csv',)
 
     DEFAULT_DELIMITER = ','
+    LINE_TERMINATOR = '\r\n'
+
+    # Characters collected before each write to a caller-supplied stream.
+    WRITE_CHUNK_SIZE = 1024 * 1024
 
     @classmethod
-    def export_stream_set(cls, DataTable, **kwargs):
-        """Returns CSV representation of DataTable as file-like."""
-        stream = StringIO()
+    def export_stream_set(cls, DataTable, out=None, **kwargs):
+        """Returns CSV representation of DataTable as file-like.
+
+        :param out: (optional) writable text stream to write into instead of
+            a new :class:`io.StringIO`; it is returned as-is, without seeking.
+        """
+        if out is None:
+            return StringIO(cls.export_set(DataTable, **kwargs))
+
+        write = out.write
+        chunk = []
+        size = 0
+        for line in cls.export_iter_set(DataTable, **kwargs):
+            chunk.append(line)
+            size += len(line)
+            if size >= cls.WRITE_CHUNK_SIZE:
+                write(''.join(chunk))
+                chunk.clear()
+                size = 0
+        if chunk:
+            write(''.join(chunk))
+        return out
 
+    @classmethod
+    def export_iter_set(cls, DataTable, **kwargs):
+        """Yields CSV representation of DataTable one line at a time."""
+        kwargs.setdefault('delimiter', cls.DEFAULT_DELIMITER)
+        return cls._iter_csv_rows(DataTable._package(dicts=False), **kwargs)
+
+    @classmethod
+    def export_set(cls, DataTable, **kwargs):
+        """Returns CSV representation of DataTable."""
         kwargs.setdefault('delimiter', cls.DEFAULT_DELIMITER)
 
-        _csv = csv.writer(stream, **kwargs)
+        if list(kwargs) == ['delimiter']:
+            text = cls._join_unquoted(DataTable._columns(), kwargs['delimiter'])
+            if text is not None:
+                return text
 
-        for row in DataTable._package(dicts=False):
-            _csv.writerow(row)
+        sink = _ListIO()
+        csv.writer(sink, **kwargs).writerows(DataTable._package(dicts=False))
+        return sink.pop()
 
-        stream.seek(0)
-        return stream
+    @classmethod
+    def _iter_csv_rows(cls, rows, **kwargs):
+        """Yields each row of ``rows`` serialized by ``csv.writer``."""
+        line = _ListIO()
+        writerow = csv.writer(line, **kwargs).writerow
+        for row in rows:
+            writerow(row)
+            yield line.pop()
 
     @classmethod
-    def export_set(cls, DataTable, **kwargs):
-        """Returns CSV representation of DataTable."""
-        stream = cls.export_stream_set(DataTable, **kwargs)
-        return stream.getvalue()
+    def _join_unquoted(cls, columns, delimiter):
+        """Joins column-major data without the csv module when no field
+        needs quoting.
+
+        Cells are stringified column by column and stitched into lines with
+        ``zip``, so no Python-level code runs per row. Returns None when a
+        value is not a plain int/float/str, or when any field would have to
+        be quoted; the caller then falls back to ``csv.writer``.
+        """
+        if not columns:
+            return ''
+        if delimiter in _NUMERIC_CHARS:
+            return None
+        if len(columns) == 1 and '' in columns[0]:
+            # csv.writer quotes a lone empty field.
+            return None
+
+        # Numbers never need quoting, so only the str cells are probed, and
+        # before anything is stringified. Each trigger is one character, so
+        # a scan of the concatenated cells finds any of them.
+        for column in columns:
+            if not _PLAIN_TYPES.issuperset(map(type, column)):
+                return None
+            try:
+                text = ''.join(column)
+            except TypeError:
+                text = ''.join([cell for cell in column if type(cell) is str])
+            if '"' in text or delimiter in text or '\r' in text or '\n' in text:
+                return None
+
+        cells = [list(map(str, column)) for column in columns]
+        return cls.LINE_TERMINATOR.join(
+            map(delimiter.join, zip(*cells))) + cls.LINE_TERMINATOR
 
     @classmethod
     def import_set(cls, dset, in_stream, headers=True, **kwargs):
@@ -40,15 +138,21 @@ class CSVFormat:
 
         kwargs.setdefault('delimiter', cls.DEFAULT_DELIMITER)
 
+        append = dset.append
+        width = 0
+
         rows = csv.reader(in_stream, **kwargs)
         for i, row in enumerate(rows):
 
             if (i == 0) and (headers):
                 dset.headers = row
+                width = dset.width
             elif row:
-                if i > 0 and len(row) < dset.width:
-                    row += [''] * (dset.width - len(row))
-                dset.append(row)
+                if len(row) < width:
+                    row.extend(('',) * (width - len(row)))
+                append(row)
+                if not width:
+                    width = dset.width
 
     @classmethod
     def detect(cls, stream, delimiter=None):
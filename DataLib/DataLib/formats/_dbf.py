@@ -1,6 +1,5 @@
 """ Tablib - DBF Support.
 """
-import io
 import os
 import tempfile
 
@@ -38,12 +37,11 @@ class DBFFormat:
             record.store()
 
         dbf_file.close()
-        dbf_stream = open(temp_uri, 'rb')
-        stream = io.BytesIO(dbf_stream.read())
-        dbf_stream.close()
+        with open(temp_uri, 'rb') as dbf_stream:
+            data = dbf_stream.read()
         os.close(temp_file)
         os.remove(temp_uri)
-        return stream.getvalue()
+        return data
 
     @classmethod
     def import_set(cls, dset, in_stream, headers=True):
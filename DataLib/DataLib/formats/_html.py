@@ -1,10 +1,7 @@
 """ Tablib - HTML export support.
 """
 
-import codecs
-from io import BytesIO
-
-from MarkupPy import markup
+from html import escape
 
 
 class HTMLFormat:
@@ -17,46 +14,31 @@ class HTMLFormat:
     def export_set(cls, DataTable):
         """HTML representation of a DataTable."""
 
-        stream = BytesIO()
-
-        page = markup.page()
-        page.table.open()
+        parts = ['<table>']
 
         if DataTable.headers is not None:
-            new_header = [item if item is not None else '' for item in DataTable.headers]
-
-            page.thead.open()
-            headers = markup.oneliner.th(new_header)
-            page.tr(headers)
-            page.thead.close()
-
-        for row in DataTable:
-            new_row = [item if item is not None else '' for item in row]
+            parts.append('<thead><tr>' + ''.join(
+                '<th>%s</th>' % escape('' if h is None else str(h))
+                for h in DataTable.headers) + '</tr></thead>')
 
-            html_row = markup.oneliner.td(new_row)
-            page.tr(html_row)
+        parts.extend('<tr>' + ''.join(
+            '<td>%s</td>' % escape('' if v is None else str(v))
+            for v in row) + '</tr>' for row in DataTable)
 
-        page.table.close()
-
-        # Allow unicode characters in output
-        wrapper = codecs.getwriter("utf8")(stream)
-        wrapper.writelines(str(page))
-
-        return stream.getvalue().decode('utf-8')
+        parts.append('</table>')
+        return ''.join(parts)
 
     @classmethod
     def export_book(cls, DataSet):
         """HTML representation of a DataSet."""
 
-        stream = BytesIO()
-
-        # Allow unicode characters in output
-        wrapper = codecs.getwriter("utf8")(stream)
+        parts = []
+        append = parts.append
 
         for i, dset in enumerate(DataSet._DataTables):
             title = (dset.title if dset.title else 'Set %s' % (i))
-            wrapper.write('<{}>{}</{}>\n'.format(cls.BOOK_ENDINGS, title, cls.BOOK_ENDINGS))
-            wrapper.write(dset.html)
-            wrapper.write('\n')
+            append('<{}>{}</{}>\n'.format(cls.BOOK_ENDINGS, title, cls.BOOK_ENDINGS))
+            append(dset.html)
+            append('\n')
 
-        return stream.getvalue().decode('utf-8')
+        return ''.join(parts)
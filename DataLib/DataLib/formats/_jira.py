@@ -2,6 +2,7 @@
 
    Generates a Jira table from the DataTable.
 """
+from itertools import chain
 
 
 class JIRAFormat:
@@ -19,13 +20,14 @@ class JIRAFormat:
         :type DataTable: tablib.core.DataTable
         """
 
-        header = cls._get_header(DataTable.headers) if DataTable.headers else ''
-        body = cls._get_body(DataTable)
-        return '{}\n{}'.format(header, body) if header else body
+        lines = map(cls._row_serializer(), DataTable)
+        if DataTable.headers:
+            lines = chain((cls._get_header(DataTable.headers),), lines)
+        return '\n'.join(lines)
 
     @classmethod
     def _get_body(cls, DataTable):
-        return '\n'.join([cls._serialize_row(row) for row in DataTable])
+        return '\n'.join(map(cls._row_serializer(), DataTable))
 
     @classmethod
     def _get_header(cls, headers):
@@ -33,8 +35,14 @@ class JIRAFormat:
 
     @classmethod
     def _serialize_row(cls, row, delimiter='|'):
-        return '{}{}{}'.format(
-            delimiter,
-            delimiter.join([str(item) if item else ' ' for item in row]),
-            delimiter
-        )
+        return cls._row_serializer(delimiter)(row)
+
+    @classmethod
+    def _row_serializer(cls, delimiter='|'):
+        join = delimiter.join
+
+        def serialize_row(row):
+            return delimiter + join(
+                ' ' if item is None or item == '' else str(item) for item in row) + delimiter
+
+        return serialize_row
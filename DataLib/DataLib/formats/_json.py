@@ -2,10 +2,18 @@
 """
 import decimal
 import json
+import math
 from uuid import UUID
 
 import tablib
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_decoder = json.JSONDecoder()
+
 
 def serialize_objects_handler(obj):
     if isinstance(obj, (decimal.Decimal, UUID)):
@@ -16,33 +24,86 @@ def serialize_objects_handler(obj):
         return obj
 
 
+def _has_non_finite(obj):
+    """Returns True if ``obj`` holds a NaN or infinite float at any depth."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        obj = obj.values()
+    elif not isinstance(obj, (list, tuple)):
+        return False
+    return any(map(_has_non_finite, obj))
+
+
+def _dumps(obj):
+    """Serializes ``obj`` with orjson when available, else with the stdlib."""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, default=serialize_objects_handler)
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the stdlib handle them.
+            pass
+        else:
+            # orjson writes NaN and Infinity as null, which would not read
+            # back; only output containing a null can have lost one.
+            if b'null' not in data or not _has_non_finite(obj):
+                return data.decode()
+    return json.dumps(obj, default=serialize_objects_handler)
+
+
+def _load(in_stream):
+    """Parses the JSON document in ``in_stream``."""
+    if orjson is None:
+        return json.load(in_stream)
+    text = in_stream.read()
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # Let the stdlib handle what orjson is stricter about, such as NaN.
+        return json.loads(text)
+
+
 class JSONFormat:
     title = 'json'
     extensions = ('json', 'jsn')
 
+    DETECT_SIZE = 4096
+    # Parse errors this close to the end of a truncated prefix are blamed
+    # on the truncation rather than on the document.
+    DETECT_TAIL = 32
+
     @classmethod
-    def export_set(cls, DataTable):
-        """Returns JSON representation of DataTable."""
-        return json.dumps(DataTable.dict, default=serialize_objects_handler)
+    def export_set(cls, DataTable, columnar=False):
+        """Returns JSON representation of DataTable.
+
+        :param columnar: (optional) emit ``{header: [values]}`` (or a list of
+            columns when no headers are set) instead of a list of rows.
+        """
+        if columnar:
+            columns = DataTable._columns()
+            if DataTable.headers:
+                return _dumps({column[0]: column[1:] for column in columns})
+            return _dumps(columns)
+        return _dumps(DataTable.dict)
 
     @classmethod
     def export_book(cls, DataSet):
         """Returns JSON representation of DataSet."""
-        return json.dumps(DataSet._package(), default=serialize_objects_handler)
+        return _dumps(DataSet._package())
 
     @classmethod
     def import_set(cls, dset, in_stream):
         """Returns DataTable from JSON stream."""
 
         dset.wipe()
-        dset.dict = json.load(in_stream)
+        dset.dict = _load(in_stream)
 
     @classmethod
     def import_book(cls, dbook, in_stream):
         """Returns DataSet from JSON stream."""
 
         dbook.wipe()
-        for sheet in json.load(in_stream):
+        for sheet in _load(in_stream):
             data = tablib.DataTable()
             data.title = sheet['title']
             data.dict = sheet['data']
@@ -50,9 +111,22 @@ class JSONFormat:
 
     @classmethod
     def detect(cls, stream):
-        """Returns True if given stream is valid JSON."""
-        try:
-            json.load(stream)
-            return True
-        except (TypeError, ValueError):
+        """Returns True if given stream is valid JSON.
+
+        Only the first ``DETECT_SIZE`` characters are parsed. A document that
+        is longer than that is accepted when it parses up to the cut-off.
+        """
+        chunk = stream.read(cls.DETECT_SIZE)
+        truncated = len(chunk) == cls.DETECT_SIZE
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode('utf-8', 'ignore')
+
+        prefix = chunk.lstrip()
+        if not prefix.startswith(('{', '[')):
             return False
+        try:
+            _, end = _decoder.raw_decode(prefix)
+        except json.JSONDecodeError as err:
+            return truncated and (err.pos >= len(prefix) - cls.DETECT_TAIL
+                                  or err.msg.startswith('Unterminated string'))
+        return truncated or not prefix[end:].strip()
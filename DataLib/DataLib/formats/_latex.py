@@ -4,6 +4,9 @@
 """
 import re
 
+ROW_INDENT = 6 * ' '
+CELL_SEPARATOR = ' & '
+
 
 class LATEXFormat:
     title = 'latex'
@@ -38,8 +41,20 @@ class LATEXFormat:
         ('%', '\\%'),
     ])
 
-    TEX_RESERVED_SYMBOLS_RE = re.compile(
-        '(%s)' % '|'.join(map(re.escape, TEX_RESERVED_SYMBOLS_MAP.keys())))
+    TEX_RESERVED_SYMBOLS_TRANSLATION = str.maketrans(TEX_RESERVED_SYMBOLS_MAP)
+
+    # Single character class over the reserved symbols, used to probe
+    # non-ASCII cells before translating them.
+    TEX_RESERVED_SYMBOLS_RE = re.compile(r'[\\{}$&#^_~%]')
+
+    # Reserved symbols as bytes, used to probe ASCII cells in C.
+    TEX_RESERVED_SYMBOLS_BYTES = ''.join(TEX_RESERVED_SYMBOLS_MAP).encode('ascii')
+
+    # Replacements applied in order on the ASCII path. Braces come first, as
+    # the escapes of '^' and '~' introduce braces; backslashes are handled
+    # by splitting on them beforehand.
+    TEX_ASCII_REPLACEMENTS = tuple(
+        item for item in TEX_RESERVED_SYMBOLS_MAP.items() if item[0] != '\\')
 
     @classmethod
     def export_set(cls, DataTable):
@@ -51,9 +66,10 @@ class LATEXFormat:
 
         caption = '\\caption{%s}' % DataTable.title if DataTable.title else '%'
         colspec = cls._colspec(DataTable.width)
-        header = cls._serialize_row(DataTable.headers) if DataTable.headers else ''
+        serialize_row = cls._row_serializer()
+        header = serialize_row(DataTable.headers) if DataTable.headers else ''
         midrule = cls._midrule(DataTable.width)
-        body = '\n'.join([cls._serialize_row(row) for row in DataTable])
+        body = '\n'.join(map(serialize_row, DataTable))
         return cls.TABLE_TEMPLATE % dict(CAPTION=caption, COLSPEC=colspec,
                                      HEADER=header, MIDRULE=midrule, BODY=body)
 
@@ -117,9 +133,21 @@ class LATEXFormat:
         :param row: single DataTable row
         """
 
-        new_row = [cls._escape_tex_reserved_symbols(str(item)) if item else ''
-                   for item in row]
-        return 6 * ' ' + ' & '.join(new_row) + ' \\\\'
+        return cls._row_serializer()(row)
+
+    @classmethod
+    def _row_serializer(cls):
+        """Returns a function serializing a single row, with the escape
+        function and separator join bound once for the whole table.
+        """
+        escape = cls._escape_tex_reserved_symbols
+        join = CELL_SEPARATOR.join
+
+        def serialize_row(row):
+            return ROW_INDENT + join(
+                escape(str(item)) if item else '' for item in row) + ' \\\\'
+
+        return serialize_row
 
     @classmethod
     def _escape_tex_reserved_symbols(cls, input):
@@ -127,6 +155,31 @@ class LATEXFormat:
 
         :param input: String to escape
         """
-        def replace(match):
-            return cls.TEX_RESERVED_SYMBOLS_MAP[match.group()]
-        return cls.TEX_RESERVED_SYMBOLS_RE.sub(replace, input)
+        if input.isascii():
+            return cls._escape_ascii(input)
+        if cls.TEX_RESERVED_SYMBOLS_RE.search(input) is None:
+            return input
+        return input.translate(cls.TEX_RESERVED_SYMBOLS_TRANSLATION)
+
+    @classmethod
+    def _escape_ascii(cls, input):
+        """Escapes TeX reserved symbols in a pure-ASCII string.
+
+        Strings without reserved symbols, the common case, are detected with
+        a single ``bytes.translate`` pass and returned unchanged.
+
+        :param input: ASCII string to escape
+        """
+        raw = input.encode('ascii')
+        if len(raw.translate(None, cls.TEX_RESERVED_SYMBOLS_BYTES)) == len(raw):
+            return input
+        if '\\' in input:
+            return cls.TEX_RESERVED_SYMBOLS_MAP['\\'].join(
+                map(cls._replace_ascii, input.split('\\')))
+        return cls._replace_ascii(input)
+
+    @classmethod
+    def _replace_ascii(cls, input):
+        for symbol, escaped in cls.TEX_ASCII_REPLACEMENTS:
+            input = input.replace(symbol, escaped)
+        return input
@@ -2,6 +2,7 @@
 """
 
 from io import BytesIO
+from operator import itemgetter
 
 from odf import opendocument, style, table, text
 
@@ -47,51 +48,69 @@ class ODSFormat:
     @classmethod
     def dset_sheet(cls, DataTable, ws):
         """Completes given worksheet from given DataTable."""
-        _package = DataTable._package(dicts=False)
+        _package = cls._merge_separators(DataTable._package(dicts=False),
+                                         DataTable._separators)
 
-        for i, sep in enumerate(DataTable._separators):
-            _offset = i
-            _package.insert((sep[0] + _offset), (sep[1],))
+        for _ in range(DataTable.width):
+            ws.addElement(table.TableColumn())
 
         for i, row in enumerate(_package):
-            row_number = i + 1
             odf_row = table.TableRow(stylename=bold, defaultcellstylename='bold')
-            for j, col in enumerate(row):
-                try:
-                    col = str(col, errors='ignore')
-                except TypeError:
-                    # col is already str
-                    pass
-                ws.addElement(table.TableColumn())
-
-                # bold headers
-                if (row_number == 1) and DataTable.headers:
-                    odf_row.setAttribute('stylename', bold)
-                    ws.addElement(odf_row)
-                    cell = table.TableCell()
-                    p = text.P()
-                    p.addElement(text.Span(text=col, stylename=bold))
-                    cell.addElement(p)
-                    odf_row.addElement(cell)
-
-                # wrap the rest
-                else:
-                    try:
-                        if '\n' in col:
-                            ws.addElement(odf_row)
-                            cell = table.TableCell()
-                            cell.addElement(text.P(text=col))
-                            odf_row.addElement(cell)
-                        else:
-                            ws.addElement(odf_row)
-                            cell = table.TableCell()
-                            cell.addElement(text.P(text=col))
-                            odf_row.addElement(cell)
-                    except TypeError:
-                        ws.addElement(odf_row)
-                        cell = table.TableCell()
-                        cell.addElement(text.P(text=col))
-                        odf_row.addElement(cell)
+            cols = [cls._decode(col) for col in row]
+
+            # bold headers
+            if (i == 0) and DataTable.headers:
+                odf_row.setAttribute('stylename', bold)
+                cells = [cls._header_cell(col) for col in cols]
+            else:
+                cells = [cls._cell(col) for col in cols]
+
+            for cell in cells:
+                odf_row.addElement(cell)
+            ws.addElement(odf_row)
+
+    @classmethod
+    def _merge_separators(cls, rows, separators):
+        """Returns rows with each ``(index, text)`` separator placed as a
+        one-cell row before the row at ``index``, built in a single pass."""
+        if not separators:
+            return rows
+
+        merged = []
+        append = merged.append
+        pending = iter(sorted(separators, key=itemgetter(0)))
+        sep = next(pending, None)
+        for i, row in enumerate(rows):
+            while sep is not None and sep[0] <= i:
+                append((sep[1],))
+                sep = next(pending, None)
+            append(row)
+        while sep is not None:
+            append((sep[1],))
+            sep = next(pending, None)
+        return merged
+
+    @classmethod
+    def _decode(cls, col):
+        try:
+            return str(col, errors='ignore')
+        except TypeError:
+            # col is already str
+            return col
+
+    @classmethod
+    def _cell(cls, col):
+        cell = table.TableCell()
+        cell.addElement(text.P(text=col))
+        return cell
+
+    @classmethod
+    def _header_cell(cls, col):
+        cell = table.TableCell()
+        p = text.P()
+        p.addElement(text.Span(text=col, stylename=bold))
+        cell.addElement(p)
+        return cell
 
     @classmethod
     def detect(cls, stream):
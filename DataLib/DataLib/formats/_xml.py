@@ -1,7 +1,10 @@
 """ Tablib - XML support.
 """
 
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+# Matches the attribute escaping of xml.etree.ElementTree.
+_ATTRIBUTE_ENTITIES = {'"': '&quot;', '\r': '&#13;', '\n': '&#10;', '\t': '&#09;'}
 
 
 class XMLFormat:
@@ -15,18 +18,28 @@ class XMLFormat:
 
     @classmethod
     def export_set(cls, DataTable):
-        root = ET.Element('DataTable')
+        rows = DataTable.dict
+        if not rows:
+            return '<DataTable />'
+
+        parts = ['<DataTable>']
+        append = parts.append
 
-        for row_index, row in enumerate(DataTable.dict):
-            row_node = ET.Element('row')
-            tags = DataTable._data[row_index].tags
+        for row, data_row in zip(rows, DataTable._data):
+            tags = data_row.tags
             if tags:
-                row_node.set('tags', ','.join(tags))
+                append('<row tags="%s">' % escape(','.join(tags), _ATTRIBUTE_ENTITIES))
+            else:
+                append('<row>')
             for header, value in row.items():
-                value_node = ET.Element(header)
-                value_node.text = str(value)
-                row_node.append(value_node)
+                value = escape(str(value))
+                if value:
+                    append('<%s>%s</%s>' % (header, value, header))
+                else:
+                    append('<%s />' % header)
+            append('</row>')
 
-            root.append(row_node)
+        append('</DataTable>')
 
-        return ET.tostring(root).decode()
+        # ElementTree.tostring() emits us-ascii with character references.
+        return ''.join(parts).encode('ascii', 'xmlcharrefreplace').decode()
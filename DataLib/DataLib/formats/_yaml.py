@@ -4,28 +4,38 @@
 import tablib
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    # PyYAML built without libyaml.
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 
 class YAMLFormat:
     title = 'yaml'
     extensions = ('yaml', 'yml')
 
+    DETECT_SIZE = 4096
+
     @classmethod
     def export_set(cls, DataTable):
         """Returns YAML representation of DataTable."""
 
-        return yaml.safe_dump(DataTable._package(ordered=False), default_flow_style=None)
+        return yaml.dump(DataTable._package(ordered=False), Dumper=_Dumper,
+                         default_flow_style=None)
 
     @classmethod
     def export_book(cls, DataSet):
         """Returns YAML representation of DataSet."""
-        return yaml.safe_dump(DataSet._package(ordered=False), default_flow_style=None)
+        return yaml.dump(DataSet._package(ordered=False), Dumper=_Dumper,
+                         default_flow_style=None)
 
     @classmethod
     def import_set(cls, dset, in_stream):
         """Returns DataTable from YAML stream."""
 
         dset.wipe()
-        dset.dict = yaml.safe_load(in_stream)
+        dset.dict = yaml.load(in_stream, Loader=_Loader)
 
     @classmethod
     def import_book(cls, dbook, in_stream):
@@ -33,7 +43,7 @@ class YAMLFormat:
 
         dbook.wipe()
 
-        for sheet in yaml.safe_load(in_stream):
+        for sheet in yaml.load(in_stream, Loader=_Loader):
             data = tablib.DataTable()
             data.title = sheet['title']
             data.dict = sheet['data']
@@ -41,13 +51,28 @@ class YAMLFormat:
 
     @classmethod
     def detect(cls, stream):
-        """Returns True if given stream is valid YAML."""
+        """Returns True if given stream is valid YAML.
+
+        Only the first ``DETECT_SIZE`` characters are read. Flow-style rows
+        span lines, so a prefix cut short by that limit may not parse; it
+        is accepted if its first node opens a sequence or mapping.
+        """
+        chunk = stream.read(cls.DETECT_SIZE)
+        try:
+            _yaml = yaml.load(chunk, Loader=_Loader)
+        except yaml.YAMLError:
+            return len(chunk) == cls.DETECT_SIZE and cls._opens_collection(chunk)
+        return isinstance(_yaml, (list, tuple, dict))
+
+    @staticmethod
+    def _opens_collection(chunk):
+        """Returns True if the first node in ``chunk`` starts a sequence or
+        mapping."""
         try:
-            _yaml = yaml.safe_load(stream)
-            if isinstance(_yaml, (list, tuple, dict)):
-                return True
-            else:
-                return False
-        except (yaml.parser.ParserError, yaml.reader.ReaderError,
-                yaml.scanner.ScannerError):
-            return False
+            for event in yaml.parse(chunk, Loader=_Loader):
+                if isinstance(event, (yaml.StreamStartEvent, yaml.DocumentStartEvent)):
+                    continue
+                return isinstance(event, (yaml.SequenceStartEvent, yaml.MappingStartEvent))
+        except yaml.YAMLError:
+            pass
+        return False
@@ -18,6 +18,9 @@ import csv
 import datetime
 import json
 import operator
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
 try:
@@ -27,7 +30,7 @@ except ImportError:
 import sys
 
 from peewee import (
-    Database, Model, ModelIndex, IntegrityError,
+    Database, Model, ModelIndex, IntegrityError, SQL, SqliteDatabase, chunked, fn,
     DateTimeField, TextField, BooleanField, IntegerField, FloatField, DecimalField
 )
 from playhouse.db_url import connect
@@ -35,16 +38,45 @@ from playhouse.migrate import migrate
 from playhouse.migrate import SchemaMigrator
 from playhouse.reflection import Introspector
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if sys.version_info[0] == 3:
     basestring = str
-    from functools import reduce
 
 
-    def open_file(f, mode, encoding='utf8'):
-        return open(f, mode, encoding=encoding)
+    def open_file(f, mode, encoding='utf8', newline=None, buffering=-1):
+        return open(f, mode, buffering, encoding=encoding, newline=newline)
 else:
-    def open_file(f, mode, encoding='utf8'):
-        return open(f, mode)
+    def open_file(f, mode, encoding='utf8', newline=None, buffering=-1):
+        return open(f, mode, buffering)
+
+try:
+    from _csv_import import load_rows
+except ImportError:
+    def load_rows(rows, indexes, converters):
+        """Pick the ``indexes`` out of each CSV row as a tuple, applying the
+        matching ``converters`` unless it is None. Missing cells are None;
+        blank lines (empty rows) are skipped.
+
+        Pure-Python fallback for the compiled ``_csv_import`` module. The
+        batch is gathered column by column and transposed once with ``zip``,
+        which keeps the per-cell work inside list comprehensions. Short rows
+        are padded in place.
+        """
+        rows = [row for row in rows if row]
+        width = max(indexes) + 1
+        for row in rows:
+            if len(row) < width:
+                row.extend([None] * (width - len(row)))
+        if converters is None:
+            columns = [[row[idx] for row in rows] for idx in indexes]
+        else:
+            columns = [[None if row[idx] is None else convert(row[idx]) for row in rows]
+                       for idx, convert in zip(indexes, converters)]
+        return list(zip(*columns))
 
 
 class DataSet(object):
@@ -144,12 +176,32 @@ class DataSet(object):
 
     """
 
-    def __init__(self, url, **kwargs):
+    # Buffer size used when thawing CSV/TSV files from disk.
+    read_buffer_size = 1 << 20
+
+    # Seconds that the table list used by ``db[name]`` and ``name in db`` is
+    # reused before the database is asked again. Tables created through the
+    # DataSet, or SQL run through query(), refresh it immediately.
+    tables_cache_ttl = 5.0
+
+    # PRAGMAs applied by default to file-backed SQLite databases opened from
+    # a URL: WAL journaling with relaxed syncing suits bulk imports.
+    sqlite_pragmas = (
+        ('journal_mode', 'wal'),
+        ('synchronous', 'normal'),
+        ('temp_store', 'memory'),
+        ('cache_size', -65536))
+
+    def __init__(self, url, pragmas=None, **kwargs):
         """
 
         Parameters
         ----------
         url: str
+        pragmas: dict or list of (name, value) pairs, optional
+            PRAGMAs to set on a SQLite database; defaults to
+            ``sqlite_pragmas`` for file-backed URLs. Pass ``{}`` to keep
+            SQLite's defaults.
         kwargs
         """
         if isinstance(url, Database):
@@ -165,6 +217,15 @@ class DataSet(object):
             self._database = connect(url)
 
         self._database.connect()
+        self._tables_cache = None
+        self._tables_cache_ts = 0
+
+        if isinstance(self._database, SqliteDatabase):
+            if (pragmas is None and self._url is not None and
+                    self._database_path not in ('', ':memory:')):
+                pragmas = self.sqlite_pragmas
+            for key, value in dict(pragmas or ()).items():
+                self._database.pragma(key, value, permanent=True)
 
         # Introspect the database and generate models.
         self._introspector = Introspector.from_database(self._database)
@@ -198,7 +259,7 @@ class DataSet(object):
             'tsv': TSVImporter}
 
     def __getitem__(self, table):
-        if table not in self._models and table in self.tables:
+        if table not in self._models and table in self._get_tables_cached():
             self.update_cache(table)
         return Table(self, table, self._models.get(table))
 
@@ -207,7 +268,19 @@ class DataSet(object):
         return self._database.get_tables()
 
     def __contains__(self, table):
-        return table in self.tables
+        return table in self._get_tables_cached()
+
+    def _get_tables_cached(self, ttl=None):
+        if ttl is None:
+            ttl = self.tables_cache_ttl
+        now = time.monotonic()
+        if self._tables_cache is None or now - self._tables_cache_ts >= ttl:
+            self._tables_cache = frozenset(self._database.get_tables())
+            self._tables_cache_ts = now
+        return self._tables_cache
+
+    def _invalidate_tables_cache(self):
+        self._tables_cache = None
 
     def connect(self):
         self._database.connect()
@@ -228,6 +301,7 @@ class DataSet(object):
         else:
             dependencies = None  # Update all tables.
             self._models = {}
+        self._invalidate_tables_cache()
         updated = self._introspector.generate_models(
             skip_invalid=True,
             table_names=dependencies,
@@ -256,6 +330,8 @@ class DataSet(object):
             self.close()
 
     def query(self, sql, params=None, commit=True):
+        # The statement may be DDL.
+        self._invalidate_tables_cache()
         return self._database.execute_sql(sql, params, commit)
 
     def transaction(self):
@@ -279,10 +355,15 @@ class DataSet(object):
     def freeze(self, query, format='csv', filename=None, file_obj=None,
                encoding='utf8', **kwargs):
         self._check_arguments(filename, file_obj, format, self._export_formats)
+        exporter_class = self._export_formats[format]
         if filename:
-            file_obj = open_file(filename, 'w', encoding)
+            if issubclass(exporter_class, CSVExporter):
+                # The csv module writes its own line terminators.
+                file_obj = open_file(filename, 'w', encoding, newline='')
+            else:
+                file_obj = open_file(filename, 'w', encoding)
 
-        exporter = self._export_formats[format](query)
+        exporter = exporter_class(query)
         exporter.export(file_obj, **kwargs)
 
         if filename:
@@ -291,10 +372,17 @@ class DataSet(object):
     def thaw(self, table, format='csv', filename=None, file_obj=None,
              strict=False, encoding='utf8', **kwargs):
         self._check_arguments(filename, file_obj, format, self._export_formats)
+        importer_class = self._import_formats[format]
         if filename:
-            file_obj = open_file(filename, 'r', encoding)
+            if issubclass(importer_class, CSVImporter):
+                # newline='' keeps newlines inside quoted fields intact, and
+                # the larger buffer cuts read calls on big files.
+                file_obj = open_file(filename, 'r', encoding, newline='',
+                                     buffering=self.read_buffer_size)
+            else:
+                file_obj = open_file(filename, 'r', encoding)
 
-        importer = self._import_formats[format](self[table], strict)
+        importer = importer_class(self[table], strict)
         count = importer.load(file_obj, **kwargs)
 
         if filename:
@@ -302,6 +390,57 @@ class DataSet(object):
 
         return count
 
+    def freeze_many(self, queries, format='csv', encoding='utf8',
+                    max_workers=4, **kwargs):
+        """Export several queries to files concurrently.
+
+        ``queries`` maps each output filename to the query written there.
+        """
+        jobs = [
+            (self.freeze, (query,),
+             dict(kwargs, format=format, filename=filename, encoding=encoding))
+            for filename, query in queries.items()]
+        self._run_many(jobs, max_workers)
+
+    def thaw_many(self, files, format='csv', strict=False, encoding='utf8',
+                  max_workers=4, **kwargs):
+        """Import several files concurrently, returning the row count loaded
+        into each table.
+
+        ``files`` maps each table name to the filename loaded into it. Tables
+        are created up front and the largest files start first. SQLite allows
+        a single writer, so its imports run one after another.
+        """
+        for table in files:
+            self[table]
+        order = sorted(files, key=lambda table: os.path.getsize(files[table]),
+                       reverse=True)
+        jobs = [
+            (self.thaw, (table,),
+             dict(kwargs, format=format, filename=files[table], strict=strict,
+                  encoding=encoding))
+            for table in order]
+        if isinstance(self._database, SqliteDatabase):
+            max_workers = 1
+        counts = dict(zip(order, self._run_many(jobs, max_workers)))
+        return {table: counts[table] for table in files}
+
+    def _run_many(self, jobs, max_workers):
+        # peewee keeps one connection per thread, which for an in-memory
+        # SQLite database would be a different, empty database.
+        in_memory = (isinstance(self._database, SqliteDatabase) and
+                     self._database.database in ('', ':memory:'))
+        if max_workers <= 1 or len(jobs) <= 1 or in_memory:
+            return [func(*args, **kwargs) for func, args, kwargs in jobs]
+
+        def run(job):
+            func, args, kwargs = job
+            with self._database.connection_context():
+                return func(*args, **kwargs)
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(run, jobs))
+
 
 class Table(object):
     """Provides a high-level API for working with rows in a given table.
@@ -321,6 +460,8 @@ class Table(object):
             model_class = self._create_model()
             model_class.create_table()
             self.dataset._models[name] = model_class
+            self.dataset._invalidate_tables_cache()
+        self._known_columns = set(self.model_class._meta.fields)
 
     @property
     def model_class(self):
@@ -330,7 +471,8 @@ class Table(object):
         return '<Table: %s>' % self.name
 
     def __len__(self):
-        return self.find().count()
+        # A plain COUNT(*), without the subquery that Select.count() wraps.
+        return self.model_class.select(fn.COUNT(SQL('*'))).scalar()
 
     def __iter__(self):
         return iter(self.find().iterator())
@@ -369,19 +511,35 @@ class Table(object):
         return [f.name for f in self.model_class._meta.sorted_fields]
 
     def _migrate_new_columns(self, data):
-        new_keys = set(data) - set(self.model_class._meta.fields)
+        new_keys = data.keys() - self._known_columns
+        if not new_keys:
+            return
+        # Another Table handle may have added columns since ours was cached.
+        self._known_columns = set(self.model_class._meta.fields)
+        new_keys -= self._known_columns
         if new_keys:
             operations = []
+            fields = []
             for key in new_keys:
                 field_class = self._guess_field_type(data[key])
                 field = field_class(null=True)
                 operations.append(
                     self.dataset._migrator.add_column(self.name, key, field))
-                field.bind(self.model_class, key)
+                fields.append((key, field))
 
             migrate(*operations)
 
-            self.dataset.update_cache(self.name)
+            # Plain nullable columns need no re-introspection; patch the
+            # cached model in place.
+            meta = self.model_class._meta
+            for key, field in fields:
+                meta.add_field(key, field)
+            self._known_columns.update(new_keys)
+
+    def force_refresh(self):
+        """Re-introspect the table, e.g. after DDL run outside this DataSet."""
+        self.dataset.update_cache(self.name)
+        self._known_columns = set(self.model_class._meta.fields)
 
     def __getitem__(self, item):
         try:
@@ -410,14 +568,64 @@ class Table(object):
         self._migrate_new_columns(data)
         return self.model_class.insert(**data).execute()
 
+    def insert_many(self, rows, columns=None):
+        """Insert a list of row dicts using a single INSERT statement.
+
+        When ``columns`` is omitted it is gathered from the rows, and any the
+        table lacks are created first, typed from the first row providing a
+        value. Given ``columns`` must already exist, and rows may then also
+        be tuples ordered like them. Rows lacking a column store NULL.
+        """
+        if not rows:
+            return
+        if columns is None:
+            sample = {}
+            for row in reversed(rows):
+                sample.update(row)
+            self._migrate_new_columns(sample)
+            columns = sample
+        combined = self.model_class._meta.combined
+        fields = [combined[key] for key in columns]
+        return self.model_class.insert_many(rows, fields=fields).execute()
+
+    def insert_bulk(self, rows, columns):
+        """Insert a list of row dicts with the DB-API ``executemany``.
+
+        Values are handed to the driver as-is, skipping peewee's per-field
+        conversion, so they must already be types the driver accepts. The
+        ``columns`` must already exist; rows lacking one store NULL. Rows may
+        also be tuples ordered like ``columns``.
+        """
+        if not rows:
+            return
+        database = self.dataset._database
+        combined = self.model_class._meta.combined
+        open_quote, close_quote = database.quote
+
+        def quote(name):
+            return open_quote + name.replace(close_quote, close_quote * 2) + close_quote
+
+        sql = 'INSERT INTO %s (%s) VALUES (%s)' % (
+            quote(self.model_class._meta.table_name),
+            ', '.join(quote(combined[key].column_name) for key in columns),
+            ', '.join([database.param] * len(columns)))
+        cursor = database.cursor()
+        if isinstance(rows[0], dict):
+            rows = [tuple([row.get(key) for key in columns]) for row in rows]
+        cursor.executemany(sql, rows)
+        return cursor.rowcount
+
     def _apply_where(self, query, filters, conjunction=None):
+        if not filters:
+            return query
         conjunction = conjunction or operator.and_
-        if filters:
-            expressions = [
-                (self.model_class._meta.fields[column] == value)
-                for column, value in filters.items()]
-            query = query.where(reduce(conjunction, expressions))
-        return query
+        fields = self.model_class._meta.fields
+        items = iter(filters.items())
+        column, value = next(items)
+        expression = fields[column] == value
+        for column, value in items:
+            expression = conjunction(expression, fields[column] == value)
+        return query.where(expression)
 
     def update(self, columns=None, conjunction=None, **data):
         self._migrate_new_columns(data)
@@ -464,45 +672,77 @@ class Exporter(object):
         raise NotImplementedError
 
 
+_datetime_types = (datetime.datetime, datetime.date, datetime.time)
+
+
+def _iso_default(o):
+    if isinstance(o, _datetime_types):
+        return o.isoformat()
+    elif isinstance(o, Decimal):
+        return str(o)
+    raise TypeError('Unable to serialize %r as JSON' % o)
+
+
+def _str_default(o):
+    if isinstance(o, _datetime_types + (Decimal,)):
+        return str(o)
+    raise TypeError('Unable to serialize %r as JSON' % o)
+
+
 class JSONExporter(Exporter):
     def __init__(self, query, iso8601_datetimes=False):
         super(JSONExporter, self).__init__(query)
         self.iso8601_datetimes = iso8601_datetimes
+        self._default = _iso_default if iso8601_datetimes else _str_default
 
-    def _make_default(self):
-        datetime_types = (datetime.datetime, datetime.date, datetime.time)
+    def _make_dumps(self):
+        default = self._default
+        if orjson is None:
+            return lambda row: json.dumps(row, default=default)
 
-        if self.iso8601_datetimes:
-            def default(o):
-                if isinstance(o, datetime_types):
-                    return o.isoformat()
-                elif isinstance(o, Decimal):
-                    return str(o)
-                raise TypeError('Unable to serialize %r as JSON' % o)
-        else:
-            def default(o):
-                if isinstance(o, datetime_types + (Decimal,)):
-                    return str(o)
-                raise TypeError('Unable to serialize %r as JSON' % o)
-        return default
+        # Send dates through ``default`` so they format as with json.
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+
+        def dumps(row):
+            try:
+                return orjson.dumps(row, default=default, option=option).decode('utf-8')
+            except TypeError:
+                # orjson rejects some values json accepts, e.g. huge integers.
+                return json.dumps(row, default=default)
+        return dumps
 
     def export(self, file_obj, **kwargs):
-        json.dump(
-            list(self.query),
-            file_obj,
-            default=self._make_default(),
-            **kwargs)
+        if kwargs:
+            # Formatting options such as indent apply to the whole document.
+            json.dump(list(self.query), file_obj, default=self._default, **kwargs)
+            return
+
+        # Stream one row at a time so memory does not grow with the result set.
+        dumps = self._make_dumps()
+        # Match the item separator of the encoder: orjson output is compact.
+        comma = ', ' if orjson is None else ','
+        write = file_obj.write
+        separator = '['
+        for row in self.query:
+            write(separator)
+            write(dumps(row))
+            separator = comma
+        write('[]' if separator == '[' else ']')
 
 
 class CSVExporter(Exporter):
     def export(self, file_obj, header=True, **kwargs):
+        """Write the query results as CSV.
+
+        Rows are read straight from the DB-API cursor, bypassing peewee's
+        row wrappers, so values are written as the driver returns them.
+        """
         writer = csv.writer(file_obj, **kwargs)
-        tuples = self.query.tuples().execute()
-        tuples.initialize()
-        if header and getattr(tuples, 'columns', None):
-            writer.writerow([column for column in tuples.columns])
-        for row in tuples:
-            writer.writerow(row)
+        sql, params = self.query.sql()
+        cursor = self.query.model._meta.database.execute_sql(sql, params)
+        if header and cursor.description:
+            writer.writerow([column[0] for column in cursor.description])
+        writer.writerows(cursor)
 
 
 class TSVExporter(CSVExporter):
@@ -512,6 +752,9 @@ class TSVExporter(CSVExporter):
 
 
 class Importer(object):
+    # Number of rows sent per INSERT statement.
+    batch_size = 500
+
     def __init__(self, table, strict=False):
         self.table = table
         self.strict = strict
@@ -520,34 +763,49 @@ class Importer(object):
         self.columns = model._meta.columns
         self.columns.update(model._meta.fields)
 
-    def load(self, file_obj):
+    def load(self, file_obj, batch_size=None):
         raise NotImplementedError
 
 
+def _load_json(file_obj, **kwargs):
+    if orjson is None or kwargs:
+        return json.load(file_obj, **kwargs)
+    text = file_obj.read()
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # Let json handle what orjson is stricter about, such as NaN.
+        return json.loads(text)
+
+
 class JSONImporter(Importer):
-    def load(self, file_obj, **kwargs):
-        data = json.load(file_obj, **kwargs)
+    def load(self, file_obj, batch_size=None, **kwargs):
+        data = _load_json(file_obj, **kwargs)
         count = 0
 
-        for row in data:
-            if self.strict:
-                obj = {}
-                for key in row:
-                    field = self.columns.get(key)
-                    if field is not None:
-                        obj[field.name] = field.python_value(row[key])
-            else:
-                obj = row
+        with self.table.dataset.transaction():
+            for batch in chunked(data, batch_size or self.batch_size):
+                if self.strict:
+                    objs = []
+                    for row in batch:
+                        obj = {}
+                        for key in row:
+                            field = self.columns.get(key)
+                            if field is not None:
+                                obj[field.name] = field.python_value(row[key])
+                        if obj:
+                            objs.append(obj)
+                else:
+                    objs = [row for row in batch if row]
 
-            if obj:
-                self.table.insert(**obj)
-                count += 1
+                self.table.insert_many(objs)
+                count += len(objs)
 
         return count
 
 
 class CSVImporter(Importer):
-    def load(self, file_obj, header=True, **kwargs):
+    def load(self, file_obj, header=True, batch_size=None, **kwargs):
         count = 0
         reader = csv.reader(file_obj, **kwargs)
         if header:
@@ -564,29 +822,46 @@ class CSVImporter(Importer):
             else:
                 header_fields = list(enumerate(header_keys))
         else:
-            header_fields = list(enumerate(self.model._meta.sorted_fields))
+            sorted_fields = self.table.model_class._meta.sorted_fields
+            if self.strict:
+                header_fields = list(enumerate(sorted_fields))
+            else:
+                header_fields = [(idx, field.name) for idx, field in enumerate(sorted_fields)]
 
         if not header_fields:
             return count
 
-        for row in reader:
-            obj = {}
-            for idx, field in header_fields:
+        indexes = tuple(idx for idx, _ in header_fields)
+        if self.strict:
+            columns = [field.name for _, field in header_fields]
+            # Bind each column's converter once; the row loop only indexes.
+            converters = tuple(field.python_value for _, field in header_fields)
+        else:
+            columns = [key for _, key in header_fields]
+            converters = None
+
+        with self.table.dataset.transaction():
+            if not self.strict:
+                # Every CSV value is a string, so one migration covers all rows.
+                self.table._migrate_new_columns(dict.fromkeys(columns, ''))
+
+            for rows in chunked(reader, batch_size or self.batch_size):
+                buf = load_rows(rows, indexes, converters)
                 if self.strict:
-                    obj[field.name] = field.python_value(row[idx])
+                    self.table.insert_many(buf, columns)
                 else:
-                    obj[field] = row[idx]
+                    # Raw strings need no conversion, so skip the ORM layer.
+                    self.table.insert_bulk(buf, columns)
 
-            self.table.insert(**obj)
-            count += 1
+                count += len(buf)
 
         return count
 
 
 class TSVImporter(CSVImporter):
-    def load(self, file_obj, header=True, **kwargs):
+    def load(self, file_obj, header=True, batch_size=None, **kwargs):
         kwargs.setdefault('delimiter', '\t')
-        return super(TSVImporter, self).load(file_obj, header, **kwargs)
+        return super(TSVImporter, self).load(file_obj, header, batch_size, **kwargs)
 
 
 def test_dataset():
@@ -1,29 +1,75 @@
+import time
+from weakref import WeakKeyDictionary
+
+
+def quote_ident(name):
+    """Quote a SQL Server identifier the way QUOTENAME() does."""
+    return "[" + str(name).replace("]", "]]") + "]"
+
+
+def _table_ident(db, table):
+    return quote_ident(db) + ".dbo." + quote_ident(table)
+
+
+# Column metadata rarely changes within a session, so repeated lookups are
+# answered from memory for CACHE_TTL seconds. Entries are kept per connection
+# and dropped with it; call clear_cache() after the underlying data changes.
+CACHE_TTL = 300
+
+_cache = WeakKeyDictionary()
+
+
+def _cached(connection, key, fetch):
+    try:
+        entries = _cache.setdefault(connection, {})
+    except TypeError:
+        # The connection does not support weak references; don't cache.
+        return fetch()
+    now = time.monotonic()
+    hit = entries.get(key)
+    if hit is not None and now - hit[0] < CACHE_TTL:
+        return hit[1]
+    value = fetch()
+    entries[key] = (now, value)
+    return value
+
+
 def get_unique(connection, db, table, col):
-    query = f"""
-    SELECT DISTINCT {col}
-    FROM {db}.dbo.{table};
-    """
-    return [x[0] for x in connection.execute(query).fetchall()]
+    query = "SELECT DISTINCT " + quote_ident(col) + " FROM " + _table_ident(db, table)
+    return list(_cached(
+        connection, ("unique", db, table, col),
+        lambda: tuple(x[0] for x in connection.execute(query).fetchall()),
+    ))
 
 
 def get_range(connection, db, table, col):
-    query = f"""
-    SELECT MIN({col}), MAX({col})
-    FROM {db}.dbo.{table};
-    """
-    return connection.execute(query).fetchall()[0]
+    query = (
+        "SELECT MIN(" + quote_ident(col) + "), MAX(" + quote_ident(col) + ")"
+        " FROM " + _table_ident(db, table)
+    )
+    return _cached(
+        connection, ("range", db, table, col),
+        lambda: tuple(connection.execute(query).fetchall()[0]),
+    )
 
 
-def get_column_strings(df):
-    # Load the actual csv file
+def clear_cache():
+    _cache.clear()
+
 
+# SQL Server column types keyed by pandas dtype name.
+_SQL_TYPES = {
+    "float64": "FLOAT",
+    "int64": "INT",
+    "object": "VARCHAR(100) COLLATE Latin1_General_BIN2",
+    "bool": "BIT",
+    "datetime64[ns]": "DATETIME2",
+}
+
+
+def get_column_strings(df):
     # Create SQL columns based on the columns of that dataframe
-    types = (
-        df.dtypes.copy()
-        .replace("float64", "FLOAT")
-        .replace("int64", "INT")
-        .replace("object", "VARCHAR(100) COLLATE Latin1_General_BIN2")
+    return ",\n".join(
+        f"{ix.lower()} {_SQL_TYPES.get(dtype.name, dtype.name)}"
+        for ix, dtype in df.dtypes.items()
     )
-
-    ls = [f"{ix.lower()} {t}" for ix, t in zip(types.index, types.values)]
-    return ",\n".join(ls)
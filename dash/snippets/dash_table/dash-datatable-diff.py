@@ -30,32 +30,36 @@ def diff_dashtable(data, data_previous, row_id_name="row_id"):
 
         assert row_id_name in _df.columns
 
-        _df = _df.set_index(row_id_name)
+    assert df.shape == df_previous.shape and df.columns.equals(df_previous.columns)
 
-    mask = df.ne(df_previous)
+    current_values, previous_values = df.values, df_previous.values
 
-    df_diff = df[mask].dropna(how="all", axis="columns").dropna(how="all", axis="rows")
+    # Cells that are null in the current data (including NaN on both
+    # sides) are not reported as changes.
+    mask = (current_values != previous_values) & ~pd.isna(current_values)
 
-    changes = []
+    # Coordinates of every changed cell, found in one vectorized pass.
+    rows, cols = np.where(mask)
 
-    for idx, row in df_diff.iterrows():
+    current = current_values[rows, cols]
 
-        row_id = row.name
+    previous = previous_values[rows, cols]
 
-        row.dropna(inplace=True)
+    row_ids = df[row_id_name].values[rows]
 
-        for change in row.iteritems():
+    col_names = df.columns.values[cols]
 
-            changes.append(
-                {
-                    row_id_name: row_id,
-                    "column_name": change[0],
-                    "current_value": change[1],
-                    "previous_value": df_previous.at[row_id, change[0]],
-                }
-            )
-
-    return changes
+    return [
+        {
+            row_id_name: row_id,
+            "column_name": column_name,
+            "current_value": current_value,
+            "previous_value": previous_value,
+        }
+        for row_id, column_name, current_value, previous_value in zip(
+            row_ids, col_names, current, previous
+        )
+    ]
 
 
 app = dash.Dash(__name__)
@@ -1,5 +1,6 @@
 import base64
 import io
+from functools import lru_cache
 
 import dash
 import dash_core_components as dcc
@@ -10,6 +11,24 @@ import dash_table
 
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+COLUMNS = ["date", "desc", "debit", "credit", "balance"]
+DISPLAY_COLUMNS = ["date", "desc", "debit"]
+
+# Dates stay text for pd.to_datetime, which knows more formats than Arrow.
+ARROW_TYPES = {
+    "date": "string",
+    "desc": "string",
+    "debit": "float64",
+    "credit": "float64",
+    "balance": "float64",
+}
+
 external_stylesheets = ["https://codepen.io/chriddyp/pen/bWLwgP.css"]
 
 app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
@@ -37,25 +56,53 @@ app.layout = html.Div(
 )
 
 
+def read_csv_arrow(decoded):
+    return pacsv.read_csv(
+        pa.BufferReader(decoded),
+        read_options=pacsv.ReadOptions(column_names=COLUMNS, use_threads=True),
+        convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.type_for_alias(t) for name, t in ARROW_TYPES.items()}
+        ),
+    )
+
+
 def parse_contents(contents, filename):
+    """Returns the uploaded file as a DataFrame, or as an Arrow table for CSV
+    files when pyarrow is installed."""
     content_type, content_string = contents.split(",")
 
     decoded = base64.b64decode(content_string)
-    if "csv" in filename:
+    name = filename.lower()
+    if name.endswith(".csv"):
         # Assume that the user uploaded a CSV file
+        if pa is not None:
+            try:
+                return read_csv_arrow(decoded)
+            except pa.ArrowInvalid:
+                pass
+        # pandas reads the bytes directly, without a decoded str copy.
         df = pd.read_csv(
-            io.StringIO(decoded.decode("utf-8")),
-            names=["date", "desc", "debit", "credit", "balance"],
+            io.BytesIO(decoded),
+            names=COLUMNS,
+            encoding="utf-8",
+            dtype={"desc": "string"},
+            parse_dates=["date"],
         )
-    elif "xls" in filename:
+    elif name.endswith((".xls", ".xlsx", ".xlsm")):
         # Assume that the user uploaded an excel file
-        df = pd.read_excel(
-            io.BytesIO(decoded), names=["date", "desc", "debit", "credit", "balance"]
-        )
+        df = pd.read_excel(io.BytesIO(decoded), names=COLUMNS, parse_dates=["date"])
 
     return df
 
 
+def concat_parsed(parsed):
+    if pa is not None and all(isinstance(p, pa.Table) for p in parsed):
+        return pa.concat_tables(parsed).to_pandas()
+    return pd.concat(
+        [p if isinstance(p, pd.DataFrame) else p.to_pandas() for p in parsed]
+    )
+
+
 @app.callback(
     Output("output-data-upload", "children"),
     [Input("upload-data", "contents")],
@@ -66,30 +113,32 @@ def update_output(list_of_contents, list_of_names):
         raise PreventUpdate
 
     try:
-        dfs = [parse_contents(c, n) for c, n in zip(list_of_contents, list_of_names)]
+        parsed = [parse_contents(c, n) for c, n in zip(list_of_contents, list_of_names)]
     except Exception as e:
         print(e)
         return html.Div(["There was an error processing this file."])
 
-    df = pd.concat(dfs)
+    df = concat_parsed(parsed)
     df = df.dropna(subset=["debit"])
+    # Statements repeat the same payees, so category codes make the isin and
+    # groupby below integer comparisons.
+    df["desc"] = df["desc"].astype("category")
+    # Already parsed for pandas-read files; Arrow leaves dates as text.
     df["date"] = pd.to_datetime(df["date"])
 
-    months = df.date.dt.month.unique()
+    df["month"] = df["date"].dt.month
+    months = df["month"].unique()
     if len(months) < 4:
         return html.Div(["You must have at least 2 full months of data"])
 
-    months = months[1:-1]
-    first_month, months = months[0], months[1:]
-
-    m1 = df[df["date"].dt.month == first_month]["desc"]
-    is_rep = m1.isin(m1)
-    for m in months:
-        next_month = df[df["date"].dt.month == m]["desc"]
-        is_rep = is_rep & m1.isin(next_month)
+    # The first and last months may be partial; a description repeats if it
+    # shows up in every full month in between.
+    middle_months = months[1:-1]
+    counts = df[df["month"].isin(middle_months)].groupby("desc", observed=True)["month"].nunique()
+    repeating = counts.index[counts == len(middle_months)]
 
-    rep = df[df["desc"].isin(m1[is_rep])]
-    rep = rep.drop(columns=["credit", "balance"])
+    # Copy only the displayed columns of the matching rows.
+    rep = df.loc[df["desc"].isin(repeating), DISPLAY_COLUMNS]
     rep["date"] = rep["date"].dt.strftime("%B %d, %Y")
     return dash_table.DataTable(
         id="table",
@@ -100,10 +149,14 @@ def update_output(list_of_contents, list_of_names):
       
 @app.callback(Output("download", "href"), [Input("choose-file", "value")])
 def table_to_csv(val):
-    df = my_dfs[val]
-    df_b64 = b64encode(df.to_csv(index=False).encode())
+    return csv_data_uri(val)
+
 
-    return "data:text/csv;base64," + df_b64.decode()
+@lru_cache(maxsize=None)
+def csv_data_uri(val):
+    # my_dfs is fixed per deployment, so each table is encoded once.
+    data = my_dfs[val].to_csv(index=False).encode()
+    return "data:text/csv;base64," + base64.b64encode(data).decode()
 
 if __name__ == "__main__":
     app.run_server(debug=True)
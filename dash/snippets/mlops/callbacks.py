@@ -1,22 +1,38 @@
 """
 This module contains the predict callback 
 """
+from functools import lru_cache
+
 from dash.dependencies import Input, Output
 
 from app import *
 
+# Rank labels do not depend on the customer, so they are built once.
+_PRODUCT_LABELS = tuple(f" Product{i}" for i in range(1, 1024))
+
+
+@lru_cache(maxsize=1)
+def load_top_predictions(model_dir):
+    """Loads the model found under model_dir once and ranks its predictions;
+    later callbacks reuse the result instead of unpickling it again."""
+    predictions, _ = model_reader(locate_model(model_dir))
+    return get_top(predictions)
+
+
 @app.callback([Output('table', component_property='columns'), Output('table', component_property='data')],[Input(component_id='uid', component_property='value')])
 def predict(uid):
     columns = []
     products_recommended = []
     if uid:
-        model_path = locate_model(os.getcwd())
-        predictions, _ = model_reader(model_path)
-        uid_predictions = get_top_n_ui(get_top(predictions), uid)
+        uid_predictions = get_top_n_ui(load_top_predictions(os.getcwd()), uid)
         prediction_rank_lenght = len(uid_predictions)
-        prediction_rank_labels = ["".join([" Product", str(i)]) for i in range(1,prediction_rank_lenght)]
-        products_recommended = pd.DataFrame(list(zip(prediction_rank_labels, uid_predictions)), columns=['Product_Rank', 'Product_id'])
-        columns=[{"name": i, "id": i} for i in products_recommended.columns]
-        return columns, products_recommended.to_dict('records')
+        prediction_rank_labels = _PRODUCT_LABELS[:prediction_rank_lenght-1]
+        if prediction_rank_lenght > len(_PRODUCT_LABELS):
+            prediction_rank_labels = [f" Product{i}" for i in range(1,prediction_rank_lenght)]
+        # DataTable only needs records, so no DataFrame is built.
+        products_recommended = [{'Product_Rank': label, 'Product_id': product}
+                                for label, product in zip(prediction_rank_labels, uid_predictions)]
+        columns=[{"name": i, "id": i} for i in ('Product_Rank', 'Product_id')]
+        return columns, products_recommended
     else:
         return columns, products_recommended
@@ -1,6 +1,14 @@
 """
 MLOps: Deploy a recommendation system as AWS Hosted Interactive Web Service
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
 def reader(df):
     """
     return a data parsed with Reader class
@@ -9,8 +17,9 @@ def reader(df):
     returns:
         data parsed
     """
-    mindata = df.rating.min()
-    maxdata = df.rating.max()
+    ratings = df.rating.to_numpy()
+    mindata = ratings.min()
+    maxdata = ratings.max()
     reader = Reader(rating_scale=(mindata,maxdata))
     data = Dataset.load_from_df(df[['userID', 'itemID', 'rating']], reader)
     return data
@@ -26,8 +35,9 @@ def preparer(data, method=None, test_size=0.25):
     """
     if method == 'train_test_split':
         trainset, testset = train_test_split(data, test_size=test_size)
-    trainset = data.build_full_trainset()
-    testset = trainset.build_testset()
+    else:
+        trainset = data.build_full_trainset()
+        testset = trainset.build_testset()
     
     return trainset, testset
 
@@ -103,7 +113,63 @@ def get_Ui(trainset, iid):
         return len(trainset.ir[trainset.to_inner_iid(iid)])
     except ValueError:
         return 0
+
+def get_Iu_map(trainset):
+    """
+    return the number of items rated by every user of the trainset
+    args:
+      trainset: training data parsed with Reader class
+    returns:
+      dict of raw user id to number of items rated
+    """
+    return {trainset.to_raw_uid(u): len(trainset.ur[u]) for u in range(trainset.n_users)}
+
+def get_Ui_map(trainset):
+    """
+    return the number of users that have rated every item of the trainset
+    args:
+      trainset: training data parsed with Reader class
+    returns:
+      dict of raw item id to number of users that rated it
+    """
+    return {trainset.to_raw_iid(i): len(trainset.ir[i]) for i in range(trainset.n_items)}
     
+def absolute_error(est, rui):
+    """
+    return the absolute error of each prediction
+    args:
+      est: array of estimated ratings
+      rui: array of true ratings
+    returns:
+      array of absolute errors
+    """
+    if ne is None:
+        return abs(est - rui)
+    # one pass in C, without a temporary for est - rui
+    return ne.evaluate('abs(est - rui)')
+
+def log_prediction_artifacts(client, run_id, run_dir, model, predictions,
+                             best_predictions, worst_predictions):
+    """
+    write the model and its best and worst predictions, and log them to a run
+    args:
+      client: MlflowClient
+      run_id: the id of the run to log to
+      run_dir: an empty directory for this run's files
+      model: trained model
+      predictions: predictions of the model
+      best_predictions, worst_predictions: dataframes of predictions
+    """
+    model_path = os.path.join(run_dir, 'model_%s.pkl' % run_id)
+    dump.dump(model_path, predictions, model)
+    client.log_artifact(run_id, model_path, 'model')
+
+    predictions_dir = os.path.join(run_dir, 'predictions_%s' % run_id)
+    os.mkdir(predictions_dir)
+    best_predictions.to_csv(os.path.join(predictions_dir, 'best-predicitions.csv'), index=False)
+    worst_predictions.to_csv(os.path.join(predictions_dir, 'worst-predicitions.csv'), index=False)
+    client.log_artifact(run_id, predictions_dir)
+
 def plotter_hist(data, productId):
     plt.hist(data_prep_4.loc[data_prep_4['productId'] == '2']['prod_ratings'])
     plt.xlabel('rating')
@@ -133,56 +199,55 @@ def mlflow_tune_tracker(data, algo_name, param_grid, param_model, method=None, r
         #Tune
         params, history_tune = tuner(data_parse, param_grid, param_model)
 
+        #Split once; every tuned model is evaluated on the same sets
+        trainset, testset = preparer(data_parse, method)
+        Iu_map = get_Iu_map(trainset)
+        Ui_map = get_Ui_map(trainset)
+
         #History
-        for index, row in history_tune.iterrows():
-            with mlflow.start_run(experiment_id=experiment_id, run_name=algo_name + str(index), nested=True) as subruns:
-
-                #Set variables 
-                bsl_options = row['params']
-                params_tune = {**params, **bsl_options}
-                trainset, testset = preparer(data_parse, method)
-
-                #Log params
-                mlflow.log_params(params_tune)
-                mlflow.log_metric('fit_time',round(row['mean_fit_time'], 3))
-                mlflow.log_metric('test_time', round(row['mean_test_time'], 3))
-                mlflow.log_metric('test_rmse_mean', round(row['mean_test_rmse'], 3))
-                mlflow.log_metric('test_mae_mean', round(row['mean_test_mae'], 3))
-                
-                #Log Model (artefact)
-                temp = tempfile.NamedTemporaryFile(prefix="model_", suffix=".pkl")
-                temp_name = temp.name
-                try:
+        #Training stays on this thread; writing and logging artifacts is I/O
+        #bound and runs in the pool, in one directory shared by all runs
+        client = MlflowClient()
+        futures = []
+        history = history_tune[['params', 'mean_fit_time', 'mean_test_time', 'mean_test_rmse', 'mean_test_mae']]
+        with tempfile.TemporaryDirectory(dir=outdata, prefix='predictions_') as artifacts_dir, \
+                ThreadPoolExecutor(max_workers=8) as executor:
+            for row in history.itertuples():
+                with mlflow.start_run(experiment_id=experiment_id, run_name=algo_name + str(row.Index), nested=True) as subruns:
+
+                    #Set variables 
+                    bsl_options = row.params
+                    params_tune = {**params, **bsl_options}
+
+                    #Log params
+                    mlflow.log_params(params_tune)
+                    mlflow.log_metric('fit_time',round(row.mean_fit_time, 3))
+                    mlflow.log_metric('test_time', round(row.mean_test_time, 3))
+                    mlflow.log_metric('test_rmse_mean', round(row.mean_test_rmse, 3))
+                    mlflow.log_metric('test_mae_mean', round(row.mean_test_mae, 3))
+
                     model, predictions = predictor(trainer(trainset, bsl_options), testset)
-                    dump.dump(temp_name, predictions, model)
-                    mlflow.log_artifact(temp_name, 'model')
-                finally:
-                    temp.close()
-
-                 #Log best and worst predictions. Log charts for validation
-                df = pd.DataFrame(predictions, columns=['uid', 'iid', 'rui', 'est', 'details'])
-                df['Iu'] = [get_Iu(trainset, uid) for uid in df.uid]
-                df['Ui'] = [get_Ui(trainset, iid) for iid in df.iid]
-                df['err'] = abs(df.est - df.rui)
-                best_predictions = df.sort_values(by='err')[:10]
-                worst_predictions = df.sort_values(by='err')[-10:]
-                
-                temp_dir = tempfile.TemporaryDirectory(dir  =  outdata, prefix='predictions_')
-                temp_dirname = temp_dir.name
-                temp_file_best = tempfile.NamedTemporaryFile(prefix="best-predicitions_", suffix=".csv", dir=temp_dirname)
-                temp_filename_best = temp_file_best.name
-                temp_file_worst = tempfile.NamedTemporaryFile(prefix="worst-predicitions_", suffix=".csv", dir=temp_dirname)
-                temp_filename_worst = temp_file_worst.name
-                try:
-                    best_predictions.to_csv(temp_filename_best, index=False)                    
-                    worst_predictions.to_csv(temp_filename_worst, index=False)
-                    mlflow.log_artifact(temp_dirname)
-                finally:
-                    temp_file_best.close()
-                    temp_file_worst.close()
-                    temp_dir.cleanup()
-                
-                    
+
+                    #Best and worst predictions
+                    df = pd.DataFrame(predictions, columns=['uid', 'iid', 'rui', 'est', 'details'])
+                    df['Iu'] = df.uid.map(Iu_map).fillna(0).astype('int32')
+                    df['Ui'] = df.iid.map(Ui_map).fillna(0).astype('int32')
+                    df['err'] = absolute_error(df.est.to_numpy(), df.rui.to_numpy())
+                    best_predictions = df.nsmallest(10, 'err')
+                    worst_predictions = df.nlargest(10, 'err').sort_values(by='err')
+
+                    #Log Model (artefact) and predictions
+                    sub_run_id = subruns.info.run_id
+                    run_dir = os.path.join(artifacts_dir, sub_run_id)
+                    os.mkdir(run_dir)
+                    futures.append(executor.submit(
+                        log_prediction_artifacts, client, sub_run_id, run_dir,
+                        model, predictions, best_predictions, worst_predictions))
+
+            #Surface any logging error before the directory is removed
+            for future in futures:
+                future.result()
+
         MlflowClient().set_tag(run_id,
                    "mlflow.note.content",
                    rundesc)
@@ -11,7 +11,9 @@ Utility module for exporting a dictionary of dataframes to excel tables, with ea
 
 from __future__ import print_function
 
+import numpy as np
 import pandas as pd
+from array import array
 from datetime import date, time
 from collections import OrderedDict
 
@@ -19,10 +21,15 @@ from xlsxwriter.utility import xl_rowcol_to_cell
 from xlsxwriter.workbook import Workbook
 from xlsxwriter.worksheet import Worksheet
 from xlsxwriter.worksheet import convert_cell_args
-from typing import Optional
+from typing import Dict
 from xlsxwriter.worksheet import (
     Worksheet, cell_number_tuple, cell_string_tuple)
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 xlApp = win32com.client.Dispatch('Excel.Application') 
 xlApp.Visible = True
 
@@ -40,6 +47,27 @@ def excel_string_width(str):
     else:
         return string_width * 1.1
 
+
+def max_string_lengths(lengths, cols, n_cols):
+    """
+    Return the longest string length seen in each of `n_cols` columns, given
+    parallel arrays of string lengths and the column each was written to.
+
+    """
+    out = np.zeros(n_cols, dtype=np.uint32)
+    np.maximum.at(out, cols, lengths)
+    return out
+
+
+if njit is not None:
+    @njit(cache=True)
+    def max_string_lengths(lengths, cols, n_cols):
+        out = np.zeros(n_cols, dtype=np.uint32)
+        for i in range(len(cols)):
+            if lengths[i] > out[cols[i]]:
+                out[cols[i]] = lengths[i]
+        return out
+
 class xlSheet(Worksheet):
     """
     Subclass of the XlsxWriter Worksheet class to override the default
@@ -49,29 +77,32 @@ class xlSheet(Worksheet):
 
     @convert_cell_args
     def write_string(self, row, col, string, cell_format=None):
-        # Overridden write_string() method to store the maximum string width
-        # seen in each column.
+        # Overridden write_string() method to record the length of every
+        # string written to each column; the maximums are reduced in one
+        # pass by max_column_widths().
 
         # Check that row and col are valid and store max and min values.
         if self._check_dimensions(row, col):
             return -1
 
-        # Set the min width for the cell. In some cases this might be the
-        # default width of 8.43. In this case we use 0 and adjust for all
-        # string widths.
-        min_width = 0
-
-        # Check if it the string is the largest we have seen for this column.
-        string_width = excel_string_width(string)
-        if string_width > min_width:
-            max_width = self.max_column_widths.get(col, min_width)
-            if string_width > max_width:
-                self.max_column_widths[col] = string_width
+        self.string_lengths.append(len(string))
+        self.string_cols.append(col)
 
         # Now call the parent version of write_string() as usual.
         return super(xlSheet, self).write_string(row, col, string,
                                                      cell_format)
 
+    def max_column_widths(self):
+        # Return {column: width} for the columns holding non-empty strings.
+        if not self.string_cols:
+            return {}
+        cols = np.frombuffer(self.string_cols, dtype=np.uint32)
+        lengths = np.frombuffer(self.string_lengths, dtype=np.uint32)
+        max_lengths = max_string_lengths(lengths, cols, int(cols.max()) + 1)
+        # Same scaling as excel_string_width().
+        return {int(col): float(max_lengths[col]) * 1.1
+                for col in np.flatnonzero(max_lengths)}
+
 
 class xlBook(Workbook):
     """
@@ -82,9 +113,10 @@ class xlBook(Workbook):
 
     def add_worksheet(self, name=None):
         # Overwrite add_worksheet() to create a xlSheet object.
-        # Also add an Worksheet attribute to store the column widths.
+        # Also add Worksheet attributes to store the string lengths.
         worksheet = super(xlBook, self).add_worksheet(name, xlSheet)
-        worksheet.max_column_widths = {}
+        worksheet.string_lengths = array('I')
+        worksheet.string_cols = array('I')
         
         return worksheet
 
@@ -128,7 +160,7 @@ class xlBook(Workbook):
         # may have been applied. This could be handled in the application code
         # below, instead.
         for worksheet in self.worksheets():
-            for column, width in worksheet.max_column_widths.items():
+            for column, width in worksheet.max_column_widths().items():
                 worksheet.set_column(column, column, width)
                 
         return super(xlBook, self).close()
@@ -165,42 +197,37 @@ class xlObject(object):
         self._attrs[name] = value
 
 
-        def get_column_width(worksheet: Worksheet, column: int) -> Optional[int]:
-    """Get the max column width in a `Worksheet` column."""
+def get_column_widths(worksheet: Worksheet) -> Dict[int, int]:
+    """Get the max width of every column in a `Worksheet` in one pass."""
     strings = getattr(worksheet, '_ts_all_strings', None)
     if strings is None:
         strings = worksheet._ts_all_strings = sorted(
             worksheet.str_table.string_table,
             key=worksheet.str_table.string_table.__getitem__)
-    lengths = set()
+    widths = {}
     for row_id, colums_dict in worksheet.table.items():  # type: int, dict
-        data = colums_dict.get(column)
-        if not data:
-            continue
-        if type(data) is cell_string_tuple:
-            iter_length = len(strings[data.string])
-            if not iter_length:
-                continue
-            lengths.add(iter_length)
-            continue
-        if type(data) is cell_number_tuple:
-            iter_length = len(str(data.number))
-            if not iter_length:
+        for column, data in colums_dict.items():
+            if type(data) is cell_string_tuple:
+                iter_length = len(strings[data.string])
+            elif type(data) is cell_number_tuple:
+                iter_length = len(str(data.number))
+            else:
                 continue
-            lengths.add(iter_length)
-    if not lengths:
-        return None
-    return max(lengths)
+            if iter_length > widths.get(column, 0):
+                widths[column] = iter_length
+    return widths
 
 
-def set_column_autowidth(worksheet: Worksheet, column: int):
+def set_columns_autowidth(worksheet: Worksheet, columns=None):
     """
-    Set the width automatically on a column in the `Worksheet`.
+    Set the width automatically on the columns in the `Worksheet`; all
+    columns holding data when `columns` is None.
     """
-    maxwidth = get_column_width(worksheet=worksheet, column=column)
-    if maxwidth is None:
-        return
-    worksheet.set_column(first_col=column, last_col=column, width=maxwidth)
+    widths = get_column_widths(worksheet=worksheet)
+    if columns is not None:
+        widths = {column: widths[column] for column in columns if column in widths}
+    for column, maxwidth in widths.items():
+        worksheet.set_column(first_col=column, last_col=column, width=maxwidth)
 
 
 class xlTemplate(xlObject):
@@ -275,9 +302,7 @@ class xlTemplate(xlObject):
             ws.write(row, 0, k+":", header_format)
             ws.write(row, 1, v, cell_format)
             row += 1
-        for idx in range(0, 1):
-            set_column_autowidth(worksheet=ws, column=idx)
-            set_column_autowidth(worksheet=ws, column=idx)
+        set_columns_autowidth(worksheet=ws, columns=range(0, 1))
 
         
     def create_ws_toc(self):
@@ -352,7 +377,7 @@ def write_dfs_to_xl_tables(xl_file, dfs):
 		for idx, col in enumerate(df):  # loop through all columns
 			series = df[col]
 			max_len = max((
-				series.astype(str).map(len).max(),  # len of largest item
+				series.astype(str).str.len().max(),  # len of largest item
 				len(str(series.name))  # len of column name/header
 				)) + 1  # pad with an additional space character
 			worksheet.set_column(idx, idx, max_len)  # set column width